@@ -14,9 +14,7 @@ import textwrap
 import ast
 import logging
 import os
-import yaml
 from pathlib import Path
-import pickle
 
 # The pysnmp module uses functionality from importlib.util and 
 # importlib.machinery, which were seperated from the importlib module
@@ -26,10 +24,71 @@ try:
     import importlib.machinery
 except ImportError:
     pass
-from pysnmp.hlapi.v1arch import *  # this imports UdpTransportTarget
+# pysnmp is imported by the SNMP methods, when first used, so that the
+# printer database can be used without loading it
 
-from pyasn1.type.univ import OctetString as OctetStringType
 from itertools import chain
+from collections import OrderedDict
+
+# @BDC ST2 status packet framing
+_ST2_HDR = b'\x00@BDC ST2\r\n'
+_ST2_NEEDLE = b'BDC ST2\r\n'
+_PAD2 = b'\x00\x00'
+
+# ST2 loading path values meaning "fixed"
+_LOADING_PATH_FIXED = frozenset({
+    b'\x01\x09\x4E',
+    b'\x01\x08\x4E\x0E\x4E\x4E\x01\x4E\x4E',
+    b'\x01\x0C\x4E\x0E\x4E\x4E\x08\x4E\x4E',
+})
+
+# "EE:" token of an EEPROM read response: address (4 hex), value (2 hex)
+_EE_RE = re.compile(rb"EE:([0-9a-fA-F]{4})([0-9a-fA-F]{2})")
+
+# two-digit hex string (as returned by read_eeprom) to int
+_HEX_LUT = {f"{i:02X}": i for i in range(256)}
+_HEX_LUT.update({f"{i:02x}": i for i in range(256)})
+
+# byte to caesar-shifted write key token (OID and hex formats)
+_CAESAR_OID = tuple("0" if b == 0 else str(b + 1) for b in range(256))
+_CAESAR_HEX = tuple(
+    '00' if b == 0 else '{0:02x}'.format(b + 1) for b in range(256)
+)
+
+# serial number pattern (10 consecutive uppercase letters or digits)
+_SERIAL_NUMBER_RE = re.compile(r'[A-Z0-9]{10}')
+
+# debug log records replayed by read_config_file():
+# line prefix -> (has OID line, has VALUE line, response is a hex dump)
+_CONFIG_RECORDS = {
+    "PRINTER_STATUS:": (False, False, True),
+    "Cartridge ": (False, False, False),
+    "SNMP_DUMP ": (False, False, False),
+    "EEPROM_DUMP ": (True, False, False),
+    "EEPROM_WRITE ": (True, True, False),
+}
+_CONFIG_RECORD_RE = re.compile("|".join(map(re.escape, _CONFIG_RECORDS)))
+
+# waste ink counters, read by get_waste_ink_levels()
+_WASTE_TYPES = ("main_waste", "borderless_waste", "first_waste",
+    "second_waste", "third_waste")
+
+# EEPROM parameters read by the get_ methods, prefetched by prefetch_eeprom()
+# (keep aligned with get_serial_number, get_printer_brand, get_printer_model,
+# get_wifi_mac_address, get_printer_head_id, get_last_printer_fatal_errors,
+# get_stats and get_ink_replacement_counters)
+_PREFETCH_KEYS = ("serial_number", "brand_name", "model_name",
+    "wifi_mac_address", "printer_head_id_h", "printer_head_id_f",
+    "last_printer_fatal_errors", "stats", "ink_replacement_counters")
+
+# get_printer_models() tokenizer and words to remove (uppercase)
+_MODEL_SPLIT_RE = re.compile(" |/")
+_MODEL_REMOVE_TOKENS = frozenset({"EPSON", "SERIES"})
+
+# command line separators of --read-eeprom and --write-eeprom lists
+_READ_LIST_SPLIT_RE = re.compile(r',\s*')
+_WRITE_LIST_SPLIT_RE = re.compile(r',\s*|;\s*|\|\s*')
+_WRITE_ITEM_SPLIT_RE = re.compile(':|=')
 
 
 class EpsonPrinter:
@@ -833,6 +892,145 @@ class EpsonPrinter:
         10332: 'Black', 10360: 'Cyan', 10361: 'Magenta', 10362: 'Yellow',  # 603XL
     }
 
+    # @BDC ST2 decoding tables used by status_parser()
+    COLOUR_IDS = {  # Ink cartridge name
+        0x01: 'Black',
+        0x03: 'Cyan',
+        0x04: 'Magenta',
+        0x05: 'Yellow',
+        0x06: 'Light Cyan',
+        0x07: 'Light Magenta',
+        0x0a: 'Light Black',
+        0x0b: 'Matte Black',
+        0x0f: 'Light Light Black',
+        0x10: 'Orange',
+        0x11: 'Green',
+    }
+
+    INK_COLOR_IDS = {  # Ink color
+        0x00: 'Black',
+        0x01: 'Cyan',
+        0x02: 'Magenta',
+        0x03: 'Yellow',
+        0x04: 'Light Cyan',
+        0x05: 'Light Magenta',
+        0x06: "Dark Yellow",
+        0x07: "Grey",
+        0x08: "Light Black",
+        0x09: "Red",
+        0x0A: "Blue",
+        0x0B: "Gloss Optimizer",
+        0x0C: "Light Grey",
+        0x0D: "Orange",
+    }
+
+    STATUS_IDS = {
+        0x00: 'Error',
+        0x01: 'Self Printing',
+        0x02: 'Busy',
+        0x03: 'Waiting',
+        0x04: 'Idle (ready to print)',
+        0x05: 'Paused',
+        0x07: 'Cleaning',
+        0x08: 'Factory shipment (not initialized)',
+        0x0a: 'Shutdown',
+        0x0f: 'Nozzle Check',
+        0x11: "Charging",
+    }
+
+    ERRCODE_IDS = {
+        0x00: "Fatal error",
+        0x01: "Other I/F is selected",
+        0x02: "Cover Open",
+        0x04: "Paper jam",
+        0x05: "Ink out",
+        0x06: "Paper out",
+        0x0c: "Paper size or paper type or paper path error",
+        0x10: "Ink overflow error (Waste ink pad counter overflow)",
+        0x11: "Wait return from the tear-off position",
+        0x12: "Double Feed",
+        0x1a: "Cartridge cover is opened error",
+        0x1c: "Cutter error (Fatal Error)",
+        0x1d: "Cutter jam error (recoverable)",
+        0x22: "Maintenance cartridge is missing error",
+        0x25: "Rear cover is opened error",
+        0x29: "CD-R tray is out error",
+        0x2a: "Memory Card loading Error",
+        0x2B: "Tray cover is opened",
+        0x2C: "Ink cartridge overflow error",
+        0x2F: "Battery abnormal voltage error",
+        0x30: "Battery abnormal temperature error",
+        0x31: "Battery is empty error",
+        0x33: "Initial filling is impossible error",
+        0x36: "Maintenance cartridge cover is opened error",
+        0x37: "Scanner or front cover is opened error",
+        0x41: "Maintenance request",
+        0x47: "Printing disable error",
+        0x4a: "Maintenance Box near End error",
+        0x4b: "Driver mismatch error ",
+    }
+
+    WARNING_IDS = {
+        0x10: "Ink low (Black or Yellow)",
+        0x11: "Ink low (Magenta)",
+        0x12: "Ink low (Yellow or Cyan)",
+        0x13: "Ink low (Cyan or Matte Black)",
+        0x14: "Ink low (Photo Black)",
+        0x15: "Ink low (Red)",
+        0x16: "Ink low (Blue)",
+        0x17: "Ink low (Gloss optimizer)",
+        0x44: "Black print mode",
+        0x51: "Cleaning Disabled (Cyan)",
+        0x52: "Cleaning Disabled (Magenta)",
+        0x53: "Cleaning Disabled (Yellow)",
+        0x54: "Cleaning Disabled (Black)",
+    }
+
+    PAPER_PATH_IDS = {
+        b'\x01\xff': "Cut sheet (Rear)",
+        b'\x03\x01': "Roll paper",
+        b'\x03\x02': "Photo Album",
+        b'\x02\x01\x00': "Cut Sheet (Auto Select)",
+        b'\x02\x01': "CD-R, cardboard",
+    }
+
+    CANCEL_CODE_IDS = {
+        b'\x01': "No request",
+        b'\xA1': "Received cancel command and printer initialization",
+        b'\x81': "Request",
+    }
+
+    TRAY_OPEN_IDS = {
+        b'\x02': "Closed",
+        b'\x03': "Open",
+    }
+
+    TEMPERATURE_IDS = {
+        b'\x01': "The printer temperature is higher than 40C",
+        b'\x00': "The printer temperature is lower than 40C",
+    }
+
+    PAPER_JAM_IDS = {
+        b'\x00': "No jams",
+        b'\x01': "Paper jammed at ejecting",
+        b'\x02': "Paper jam in rear ASF or no feed",
+        b'\x80': "No papers at rear ASF",
+    }
+
+    INTERFACE_STATUS_IDS = {
+        b'\x00': "Available to accept data and reply",
+        b'\x01': "Not available to accept data",
+    }
+
+    ST2_LOOKUP_FIELDS = {  # ST2 ftype: (field name, decoding table)
+        0x06: ("paper_path", PAPER_PATH_IDS),  # Paper path
+        0x13: ("cancel_code", CANCEL_CODE_IDS),  # Cancel code
+        0x18: ("tray_open", TRAY_OPEN_IDS),  # Stacker(tray) open status
+        0x1c: ("temperature", TEMPERATURE_IDS),  # Temperature information
+        0x35: ("paper_jam", PAPER_JAM_IDS),  # Paper jam error information
+        0x3d: ("interface_status", INTERFACE_STATUS_IDS),  # Printer I/F status
+    }
+
     MIB_MGMT = "1.3.6.1.2"
     PRINT_MIB = MIB_MGMT + ".1.43"
     MIB_OID_ENTERPRISE = "1.3.6.1.4.1"
@@ -897,6 +1095,12 @@ class EpsonPrinter:
     hostname: str
     parm: dict
     mib_dict: dict = {}
+    oid_batch_size: int = 8  # max number of OIDs in a single SNMP request
+    static_cache_ttl: float = 3600  # seconds (firmware version, cartridges)
+    status_cache_ttl: float = 5  # seconds (printer status, SNMP information)
+    eeprom_cache_ttl: float = 0  # seconds (EEPROM reads, 0 = no cache)
+    stats_eeprom_ttl: float = 5  # seconds (EEPROM reads within stats())
+    oid_cache_size: int = 1024  # max number of cached SNMP responses
 
     def __init__(
             self,
@@ -907,7 +1111,8 @@ class EpsonPrinter:
             port: int = 161,
             timeout: (None, float) = None,
             retries: (None, float) = None,
-            dry_run: bool = False
+            dry_run: bool = False,
+            oid_batch_size: (None, int) = None
         ) -> None:
         """Initialise printer model."""
         def merge(source, destination):
@@ -925,8 +1130,6 @@ class EpsonPrinter:
             self.expand_printer_conf(conf_dict)
         if conf_dict and replace_conf:
             self.PRINTER_CONFIG = conf_dict
-        else:
-            self.expand_printer_conf(self.PRINTER_CONFIG)
         if conf_dict and not replace_conf:
             self.PRINTER_CONFIG = merge(self.PRINTER_CONFIG, conf_dict)
             for key, values in self.PRINTER_CONFIG.items():
@@ -943,9 +1146,14 @@ class EpsonPrinter:
         self.timeout = timeout
         self.retries = retries
         self.dry_run = dry_run
-        if self.model in self.valid_printers:
-            self.parm = self.PRINTER_CONFIG[self.model]
-        else:
+        if oid_batch_size:
+            self.oid_batch_size = oid_batch_size
+        self.oid_cache = OrderedDict()  # mib -> (time, expiry, response)
+        self.read_oid_prefix = None  # (read key, EEPROM read OID prefix)
+        self.write_oid_prefix = None  # (keys, write OID prefix, suffix)
+        self.session = None
+        self.parm = self.PRINTER_CONFIG.get(self.model)
+        if self.parm is not None and "read_key" not in self.parm:
             self.parm = None
 
     @property
@@ -953,8 +1161,8 @@ class EpsonPrinter:
         """Return list of defined printers."""
         return {
             printer_name
-            for printer_name in self.PRINTER_CONFIG.keys()
-            if "read_key" in self.PRINTER_CONFIG[printer_name]
+            for printer_name, printer_data in self.PRINTER_CONFIG.items()
+            if "read_key" in printer_data
         }
 
     @property
@@ -967,12 +1175,21 @@ class EpsonPrinter:
         A conforming method shall start with "get_".
         Do not use "get_" for new methods if you do not want them to be part
         of list_methods.
+        The list is computed once per class.
         """
-        return(filter(lambda x: x.startswith("get_"), dir(self)))
+        cls = type(self)
+        if "info_methods" not in cls.__dict__:
+            cls.info_methods = tuple(
+                name for name in dir(cls) if name.startswith("get_")
+            )
+        return cls.info_methods
 
-    def expand_printer_conf(self, conf):
+    @staticmethod
+    def expand_printer_conf(conf):
         """
-        Expand "alias" and "same-as" of a printer database for all printers
+        Expand "alias" and "same-as" of a printer database for all printers.
+        The built-in PRINTER_CONFIG is expanded once, when the module is
+        imported.
         """
         # process "alias" definintion
         for printer_name, printer_data in conf.copy().items():
@@ -1034,22 +1251,56 @@ class EpsonPrinter:
 
     def stats(self):
         """Return all available information about a printer."""
-        stat_set = {}
-        for method in self.list_methods:
-            ret = self.__getattribute__(method)()
-            if ret:
-                stat_set[method[4:]] = ret
-            else:
-                logging.info(f"No value for method '{method}'.")
+        ttl = self.eeprom_cache_ttl
+        # the EEPROM reads of the get_ methods are served by the prefetch
+        self.eeprom_cache_ttl = max(ttl, self.stats_eeprom_ttl)
+        try:
+            self.prefetch_eeprom()
+            stat_set = {}
+            for method in self.list_methods:
+                ret = getattr(self, method)()
+                if ret:
+                    stat_set[method[4:]] = ret
+                else:
+                    logging.info(f"No value for method '{method}'.")
+        finally:
+            self.eeprom_cache_ttl = ttl
         return stat_set
 
+    def prefetch_eeprom(self):
+        """
+        Read at once all the EEPROM addresses used by the get_ methods, so
+        that the following reads are served from the cache for
+        eeprom_cache_ttl seconds and the SNMP queries are filled across
+        methods. Used by stats(); nothing is read if eeprom_cache_ttl is 0.
+        """
+        def addresses(value):
+            if isinstance(value, int):
+                yield value
+            elif isinstance(value, dict):
+                for item in value.values():
+                    yield from addresses(item)
+            else:
+                for item in value:
+                    yield from addresses(item)
+
+        if not self.parm or not self.eeprom_cache_ttl:
+            return
+        oids = {}
+        for key in _PREFETCH_KEYS:
+            if key in self.parm:
+                oids.update(dict.fromkeys(addresses(self.parm[key])))
+        for waste_type in _WASTE_TYPES:
+            if waste_type in self.parm:
+                oids.update(
+                    dict.fromkeys(addresses(self.parm[waste_type]["oids"])))
+        self.read_eeprom_batch(oids, label="prefetch_eeprom")
+
     def caesar(self, key, hex=False):
         """Convert the string write key to a sequence of numbers"""
         if hex:
-            return " ".join(
-                '00' if b == 0 else '{0:02x}'.format(b + 1) for b in key
-            )
-        return ".".join("0" if b == 0 else str(b + 1) for b in key)
+            return " ".join([_CAESAR_HEX[b] for b in key])
+        return ".".join([_CAESAR_OID[b] for b in key])
 
 
     def reverse_caesar(self, eight_bytes):
@@ -1073,8 +1324,8 @@ class EpsonPrinter:
         Return None in case of error.
         """
         if oid > 255:
-            msb = oid // 256
-            oid = oid % 256
+            msb = oid >> 8
+            oid = oid & 0xFF
         if msb > 255:
             logging.error("EpsonPrinter - invalid API usage")
             return None
@@ -1083,15 +1334,20 @@ class EpsonPrinter:
             return None
         if 'read_key' not in self.parm:
             return None
-        return (
-            f"{self.EEPROM_LINK}"
-            ".124.124"  # || (7C 7C)
-            ".7.0"  # read (07 00)
-            f".{self.parm['read_key'][0]}"
-            f".{self.parm['read_key'][1]}"
-            ".65.190.160"
-            f".{oid}.{msb}"
-        )
+        read_key = self.parm['read_key']
+        cache_key = read_key[0], read_key[1]
+        if (
+                self.read_oid_prefix is None
+                or self.read_oid_prefix[0] != cache_key):
+            self.read_oid_prefix = cache_key, (
+                f"{self.EEPROM_LINK}"
+                ".124.124"  # || (7C 7C)
+                ".7.0"  # read (07 00)
+                f".{read_key[0]}"
+                f".{read_key[1]}"
+                ".65.190.160"
+            )
+        return f"{self.read_oid_prefix[1]}.{oid}.{msb}"
 
     def eeprom_oid_write_address(
             self,
@@ -1105,8 +1361,8 @@ class EpsonPrinter:
         Return None in case of error.
         """
         if oid > 255:
-            msb = oid // 256
-            oid = oid % 256
+            msb = oid >> 8
+            oid = oid & 0xFF
         if msb > 255:
             logging.error("EpsonPrinter - invalid API usage")
             return None
@@ -1117,22 +1373,84 @@ class EpsonPrinter:
             'write_key' not in self.parm
                 or 'read_key' not in self.parm):
             return None
-        write_op = (
-            f"{self.EEPROM_LINK}"
-            ".124.124"  # || 7C 7C
-            ".16.0"  # write (10 00)
-            f".{self.parm['read_key'][0]}"
-            f".{self.parm['read_key'][1]}"
-            ".66.189.33"  # 42 BD 21
-            f".{oid}.{msb}.{value}"
-            f".{self.caesar(self.parm['write_key'])}"
-        )
+        read_key = self.parm['read_key']
+        write_key = self.parm['write_key']
+        cache_key = read_key[0], read_key[1], bytes(write_key)
+        if (
+                self.write_oid_prefix is None
+                or self.write_oid_prefix[0] != cache_key):
+            self.write_oid_prefix = (
+                cache_key,
+                f"{self.EEPROM_LINK}"
+                ".124.124"  # || 7C 7C
+                ".16.0"  # write (10 00)
+                f".{read_key[0]}"
+                f".{read_key[1]}"
+                ".66.189.33",  # 42 BD 21
+                self.caesar(write_key)
+            )
+        cache_key, prefix, suffix = self.write_oid_prefix
+        write_op = f"{prefix}.{oid}.{msb}.{value}.{suffix}"
         if self.dry_run:
             logging.warning("WRITE_DRY_RUN: %s", write_op)
             return self.eeprom_oid_read_address(oid, label=label)
         else:
             return write_op
 
+    def snmp_transport_target(self):
+        """Return the UDP transport target of the printer (None if error)."""
+        from pysnmp.hlapi.v1arch import UdpTransportTarget
+
+        try:
+            utt = UdpTransportTarget(
+                    (self.hostname, self.port),
+                )
+        except Exception as e:
+            logging.critical("snmp_mib invalid address: %s", e)
+            return None
+        if self.timeout is not None:
+            utt.timeout = self.timeout
+        if self.retries is not None:
+            utt.retries = self.retries
+        return utt
+
+    def snmp_session(self):
+        """
+        Return the (dispatcher, community, transport target) tuple shared
+        by all the SNMP queries of the printer, creating it on first use.
+        Return None if the printer address is invalid.
+        """
+        if self.session is None:
+            from pysnmp.hlapi.v1arch import SnmpDispatcher, CommunityData
+
+            utt = self.snmp_transport_target()
+            if utt is None:
+                return None
+            self.session = (
+                SnmpDispatcher(),
+                CommunityData('public', mpModel=0),
+                utt
+            )
+        return self.session
+
+    def close(self):
+        """
+        Release the SNMP session of the printer, closing the transport
+        dispatcher and its sockets; a new session is created by the next
+        SNMP query.
+        """
+        if self.session:
+            self.session[0].transportDispatcher.closeDispatcher()
+        self.session = None
+
+    def snmp_varbind_value(self, varBind) -> (str, Any):
+        """Return tag and value of a variable binding of a SNMP response."""
+        from pyasn1.type.univ import OctetString as OctetStringType
+
+        if isinstance(varBind[1], OctetStringType):
+            return varBind[1].__class__.__name__, varBind[1].asOctets()
+        return varBind[1].__class__.__name__, varBind[1].prettyPrint()
+
     def snmp_mib(self, mib: str, label: str = "unknown") -> (str, Any):
         """Generic SNMP query, returning value of a MIB."""
         if self.mib_dict:
@@ -1147,54 +1465,38 @@ class EpsonPrinter:
             return self.mib_dict[mib]
         if not self.hostname:
             return None, False
-        try:
-            utt = UdpTransportTarget(
-                    (self.hostname, self.port),
-                )
-        except Exception as e:
-            logging.critical("snmp_mib invalid address: %s", e)
+        session = self.snmp_session()
+        if session is None:
             return None, False
-        if self.timeout is not None:
-            utt.timeout = self.timeout
-        if self.retries is not None:
-            utt.retries = self.retries
-        iterator = getCmd(
-            SnmpDispatcher(),
-            CommunityData('public', mpModel=0),
-            utt,
-            (mib, None)
-        )
-        for response in iterator:
-            errorIndication, errorStatus, errorIndex, varBinds = response
-            if errorIndication:
-                logging.info(
-                    "snmp_mib error: %s. MIB: %s. Operation: %s",
-                    errorIndication, mib, label
-                )
-                if " timed out" in errorIndication:
-                    raise TimeoutError(errorIndication)
-                return None, False
-            elif errorStatus:
-                logging.info(
-                    'snmp_mib PDU error: %s at %s. MIB: %s. Operation: %s',
-                    errorStatus.prettyPrint(),
-                    errorIndex and varBinds[int(errorIndex) - 1][0] or '?',
-                    mib,
-                    label
-                )
-                return None, False
-            else:
-                for varBind in varBinds:
-                    if isinstance(varBind[1], OctetStringType):
-                        return(
-                            varBind[1].__class__.__name__,
-                            varBind[1].asOctets()
-                        )
-                    else:
-                        return(
-                            varBind[1].__class__.__name__,
-                            varBind[1].prettyPrint()
-                        )
+        from pysnmp.hlapi.v1arch import getCmd
+
+        response = next(getCmd(*session, (mib, None)), None)
+        if response is None:
+            logging.info(
+                "snmp_mib value error: invalid data. MIB: %s. Operation: %s",
+                mib,
+                label
+            )
+            return None, False
+        errorIndication, errorStatus, errorIndex, varBinds = response
+        if errorIndication:
+            logging.info(
+                "snmp_mib error: %s. MIB: %s. Operation: %s",
+                errorIndication, mib, label
+            )
+            if " timed out" in errorIndication:
+                raise TimeoutError(errorIndication)
+            return None, False
+        if errorStatus:
+            logging.info(
+                'snmp_mib PDU error: %s at %s. MIB: %s. Operation: %s',
+                errorStatus.prettyPrint(),
+                errorIndex and varBinds[int(errorIndex) - 1][0] or '?',
+                mib,
+                label
+            )
+            return None, False
+        if not varBinds:
             logging.info(
                 "snmp_mib value error: invalid multiple data. "
                 "MIB: %s. Operation: %s",
@@ -1202,11 +1504,191 @@ class EpsonPrinter:
                 label
             )
             return None, False
-        logging.info(
-            "snmp_mib value error: invalid data. MIB: %s. Operation: %s",
-            label
+        return self.snmp_varbind_value(varBinds[0])
+
+    def snmp_mib_cached(
+            self,
+            mib: str,
+            ttl: float,
+            label: str = "unknown") -> (str, Any):
+        """
+        Same as snmp_mib(), reusing the valid response of the same MIB
+        if received less than 'ttl' seconds before.
+        """
+        return self.snmp_mib_many_cached([mib], ttl, label=label)[0]
+
+    def snmp_mib_many_cached(
+            self,
+            mibs: list,
+            ttl: float,
+            label: str = "unknown",
+            log_response=None) -> list:
+        """
+        Same as snmp_mib_many(), reusing the valid responses of the MIBs
+        received less than 'ttl' seconds before; only the other MIBs are
+        queried. If set, log_response(index, response) is called for each
+        response actually received from the printer.
+        """
+        mibs = list(mibs)
+        if not isinstance(label, str):
+            label = list(label)
+        response = [None] * len(mibs)
+        missing = []
+        now = time.monotonic()
+        for i, mib in enumerate(mibs):
+            if mib in self.oid_cache:
+                timestamp, expiry, cached_response = self.oid_cache[mib]
+                if now - timestamp < ttl and now < expiry:
+                    self.oid_cache.move_to_end(mib)
+                    response[i] = cached_response
+                    continue
+            missing.append(i)
+        if not missing:
+            return response
+        missing_response = self.snmp_mib_many(
+            [mibs[i] for i in missing],
+            label=label if isinstance(label, str) else [
+                label[i] for i in missing
+            ]
         )
-        return None, False
+        for i, mib_response in zip(missing, missing_response):
+            response[i] = mib_response
+            if log_response:
+                log_response(i, mib_response)
+        if ttl > 0 and not self.mib_dict:
+            self.cache_responses(
+                ((mibs[i], response[i]) for i in missing), ttl)
+        return response
+
+    def cache_responses(self, mib_responses, ttl: float) -> None:
+        """
+        Store the valid (mib, response) items in oid_cache for 'ttl'
+        seconds, dropping the expired entries and then the least recently
+        used ones beyond oid_cache_size.
+        """
+        now = time.monotonic()
+        expired = [
+            mib for mib, (_, expiry, _) in self.oid_cache.items()
+            if expiry <= now
+        ]
+        for mib in expired:
+            del self.oid_cache[mib]
+        for mib, response in mib_responses:
+            if response[1]:
+                self.oid_cache[mib] = now, now + ttl, response
+                self.oid_cache.move_to_end(mib)
+        while len(self.oid_cache) > self.oid_cache_size:
+            self.oid_cache.popitem(last=False)
+
+    def snmp_mib_many(self, mibs: list, label: str = "unknown") -> list:
+        """
+        Generic SNMP query of a list of MIBs, returning the list of
+        (tag, value) tuples in the same order of 'mibs'.
+        'label' is the operation logged with the errors; it can also be a
+        list with the label of each MIB.
+        MIBs are packed into multi-varbind GET requests of up to
+        oid_batch_size elements (see snmp_mib_batch()).
+        """
+        mibs = list(mibs)
+        if isinstance(label, str):
+            labels = [label] * len(mibs)
+        else:
+            labels = list(label)
+        if self.mib_dict or not self.hostname:
+            return [
+                self.snmp_mib(mib, label=label)
+                for mib, label in zip(mibs, labels)
+            ]
+        session = self.snmp_session()
+        if session is None:
+            return [(None, False)] * len(mibs)
+        response = []
+        first = 0
+        while first < len(mibs):
+            # oid_batch_size can be lowered by snmp_mib_batch()
+            last = first + max(1, self.oid_batch_size)
+            response += self.snmp_mib_batch(
+                session, mibs[first:last], labels[first:last])
+            first = last
+        return response
+
+    def snmp_mib_batch(
+            self,
+            session: tuple,
+            batch: list,
+            labels: list) -> list:
+        """
+        Query all the MIBs of 'batch' with a single SNMP GET request;
+        'labels' includes the label of each MIB.
+        If the printer rejects the request:
+        - noSuchName: the MIB pointed by the error index is dropped and
+          the others are queried again;
+        - tooBig: oid_batch_size is halved and the MIBs are queried again
+          with smaller requests;
+        - any other error: the printer does not support multi-varbind
+          requests, so oid_batch_size is set to 1 and each MIB is queried
+          separately.
+        The lowered oid_batch_size is kept for the next queries.
+        """
+        if len(batch) < 2:
+            return [
+                self.snmp_mib(mib, label=label)
+                for mib, label in zip(batch, labels)
+            ]
+        from pysnmp.hlapi.v1arch import getCmd
+
+        operation = ", ".join(dict.fromkeys(labels))
+
+        errorIndication, errorStatus, errorIndex, varBinds = next(
+            getCmd(*session, *[(mib, None) for mib in batch]),
+            (None, None, None, [])
+        )
+        if errorIndication:
+            logging.info(
+                "snmp_mib_batch error: %s. MIBs: %s. Operation: %s",
+                errorIndication, batch, operation
+            )
+            if " timed out" in errorIndication:
+                raise TimeoutError(errorIndication)
+            return [(None, False)] * len(batch)
+        if not errorStatus and len(varBinds) == len(batch):
+            return [self.snmp_varbind_value(varBind) for varBind in varBinds]
+        status = int(errorStatus) if errorStatus else None
+        index = int(errorIndex) if errorIndex else 0
+        if status == 2 and 0 < index <= len(batch):  # noSuchName
+            logging.info(
+                'snmp_mib PDU error: %s at %s. MIB: %s. Operation: %s',
+                errorStatus.prettyPrint(),
+                index,
+                batch[index - 1],
+                labels[index - 1]
+            )
+            response = self.snmp_mib_batch(
+                session,
+                batch[:index - 1] + batch[index:],
+                labels[:index - 1] + labels[index:]
+            )
+            response.insert(index - 1, (None, False))
+            return response
+        if status == 1:  # tooBig
+            self.oid_batch_size = max(1, len(batch) // 2)
+            logging.debug(
+                "snmp_mib_batch: batch of %s MIBs too big. "
+                "Lowering oid_batch_size to %s. Operation: %s",
+                len(batch), self.oid_batch_size, operation
+            )
+            return self.snmp_mib_many(batch, label=labels)
+        self.oid_batch_size = 1
+        logging.debug(
+            "snmp_mib_batch: batch of %s MIBs rejected (%s). "
+            "Querying one MIB at a time. Operation: %s",
+            len(batch),
+            errorStatus and errorStatus.prettyPrint(),
+            operation
+        )
+        return [
+            self.snmp_mib(mib, label=label) for mib, label in zip(batch, labels)
+        ]
 
     def invalid_response(self, response):
         if response is False:
@@ -1217,16 +1699,69 @@ class EpsonPrinter:
             self,
             oid: int,
             label: str = "unknown method") -> str:
-        """Read a single byte from the Epson EEPROM address 'oid'."""
+        """
+        Read a single byte from the Epson EEPROM address 'oid'
+        (cached only if eeprom_cache_ttl is set, see read_eeprom_batch).
+        """
+        return self.read_eeprom_batch([oid], label=label)[0]
+
+    def read_eeprom_batch(
+            self,
+            oids: list,
+            label: str = "unknown method") -> list:
+        """
+        Read the bytes of the list of Epson EEPROM addresses 'oids'.
+        The read requests are packed into multi-varbind SNMP queries
+        (see snmp_mib_many). Addresses are always queried unless
+        eeprom_cache_ttl is set (stats() sets it to stats_eeprom_ttl): then
+        addresses read less than eeprom_cache_ttl seconds before, with the
+        same read key, are not queried again and their values might be stale.
+        Return the list of values, including None for each address that
+        could not be read.
+        """
+        oids = list(oids)
+        addresses = [
+            self.eeprom_oid_read_address(oid, label=label) for oid in oids
+        ]
+        responses = self.snmp_mib_many_cached(
+            addresses, self.eeprom_cache_ttl, label=label,
+            log_response=lambda i, response: self.log_eeprom_response(
+                oids[i], addresses[i], *response, label=label)
+        )
+        return [
+            self.eeprom_response_value(oid, tag, response, label)
+            for oid, (tag, response) in zip(oids, responses)
+        ]
+
+    def log_eeprom_response(
+            self,
+            oid: int,
+            address: str,
+            tag: str,
+            response: Any,
+            label: str = "unknown method") -> None:
+        """
+        Log the SNMP response to the read request of the Epson EEPROM
+        address 'oid' (EEPROM_DUMP record, see read_config_file).
+        """
         logging.debug(
             f"EEPROM_DUMP {label}:\n"
-            f"  ADDRESS: "
-            f"{self.eeprom_oid_read_address(oid, label=label)}\n"
+            f"  ADDRESS: {address}\n"
             f"  OID: {oid}={hex(oid)}"
         )
-        tag, response = self.snmp_mib(
-            self.eeprom_oid_read_address(oid, label=label), label=label
-        )
+        if response and not self.invalid_response(response):
+            logging.debug("  TAG: %s\n  RESPONSE: %s", tag, repr(response))
+
+    def eeprom_response_value(
+            self,
+            oid: int,
+            tag: str,
+            response: Any,
+            label: str = "unknown method") -> str:
+        """
+        Return the byte value included in the SNMP response to the read
+        request of the Epson EEPROM address 'oid' (None if error).
+        """
         if not response:
             return None
         if self.invalid_response(response):
@@ -1235,15 +1770,13 @@ class EpsonPrinter:
                 repr(response), oid, label
             )
             return None
-        logging.debug("  TAG: %s\n  RESPONSE: %s", tag, repr(response))
         try:
-            response = re.findall(
-                r"EE:[0-9a-fA-F]{6}", response.decode())[0][3:]
-        except (TypeError, IndexError):
+            chk_addr, value = _EE_RE.search(response).groups()
+        except (TypeError, AttributeError):
             logging.info(f"Invalid read key.")
             return None
-        chk_addr = response[0:4]
-        value = response[4:6]
+        chk_addr = chk_addr.decode()
+        value = value.decode()
         if int(chk_addr, 16) != oid:
             raise ValueError(
                 f"Address and response address are"
@@ -1257,11 +1790,18 @@ class EpsonPrinter:
             label: str = "unknown method") -> list:
         """
         Read a list of bytes from the list of Epson EEPROM addresses 'oids'.
+        Addresses are read in batches of oid_batch_size elements; return
+        [None] as soon as a batch includes an address that cannot be read.
         """
-        response = [self.read_eeprom(oid, label=label) for oid in oids]
-        for i in response:
-            if i is None:
+        oids = list(oids)
+        response = []
+        batch_size = max(1, self.oid_batch_size)
+        for first in range(0, len(oids), batch_size):
+            values = self.read_eeprom_batch(
+                oids[first:first + batch_size], label=label)
+            if None in values:
                 return [None]
+            response += values
         return response
 
     def write_eeprom(
@@ -1270,6 +1810,17 @@ class EpsonPrinter:
             value: int,
             label: str = "unknown method") -> None:
         """Write a single byte 'value' to the Epson EEPROM address 'oid'."""
+        return self.write_eeprom_many([(oid, value)], label=label)
+
+    def write_eeprom_many(
+            self,
+            oids_values: list,
+            label: str = "unknown method") -> bool:
+        """
+        Write a list of (oid, value) bytes to the Epson EEPROM.
+        The write requests are packed into multi-varbind SNMP queries
+        (see snmp_mib_many); return False at the first failed write.
+        """
         if not self.parm:
             logging.error("EpsonPrinter - invalid API usage")
             return False
@@ -1277,29 +1828,49 @@ class EpsonPrinter:
             logging.error(
                 f"Missing 'write_key' parameter in configuration.")
             return False
+        oids_values = list(oids_values)
+        debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+        if debug and not self.dry_run:
+            for oid, value in oids_values:
+                response = self.read_eeprom(oid, label=label)
+                logging.debug(f"Previous value for {label}: {response}")
+        oid_strings = [
+            self.eeprom_oid_write_address(oid, value, label=label)
+            for oid, value in oids_values
+        ]
+        responses = self.snmp_mib_many(oid_strings, label=label)
         if not self.dry_run:
-            response = self.read_eeprom(oid, label=label)
-            logging.debug(f"Previous value for {label}: {response}")
-        oid_string = self.eeprom_oid_write_address(oid, value, label=label)
-        logging.debug(
-            f"EEPROM_WRITE {label}:\n"
-            f"  ADDRESS: {oid_string}\n"
-            f"  OID: {oid}={hex(oid)}\n"
-            f"  VALUE: {value} = {hex(int(value))}"
-        )
-        tag, response = self.snmp_mib(oid_string, label=label)
-        if response:
-            logging.debug("  TAG: %s\n  RESPONSE: %s", tag, repr(response))
-        if not self.dry_run and response and not ":OK;" in repr(response):
-            logging.info(
-                "Write error. Oid=%s, value=%s, label=%s", oid, value, label)
-            return False  # ":NA;" is an error
-        if self.invalid_response(response):
-            logging.error(
-                "Invalid write response. Oid=%s, value=%s, label=%s",
-                oid, value, label
-            )
-            return False
+            self.oid_cache.clear()  # cached responses might be changed
+        for (oid, value), oid_string, (tag, response) in zip(
+                oids_values, oid_strings, responses):
+            if debug:
+                logging.debug(
+                    f"EEPROM_WRITE {label}:\n"
+                    f"  ADDRESS: {oid_string}\n"
+                    f"  OID: {oid}={hex(oid)}\n"
+                    f"  VALUE: {value} = {hex(int(value))}"
+                )
+                if response:
+                    logging.debug("  TAG: %s\n  RESPONSE: %r", tag, response)
+            if response and not isinstance(response, (bytes, bytearray)):
+                logging.error(
+                    "Invalid write response type %s: %r. "
+                    "Oid=%s, value=%s, label=%s",
+                    tag, response, oid, value, label
+                )
+                return False
+            if not self.dry_run and response and b":OK;" not in response:
+                logging.info(
+                    "Write error. Oid=%s, value=%s, label=%s",
+                    oid, value, label
+                )
+                return False  # ":NA;" is an error
+            if self.invalid_response(response):
+                logging.error(
+                    "Invalid write response. Oid=%s, value=%s, label=%s",
+                    oid, value, label
+                )
+                return False
         return True
 
     def status_parser(self, data):
@@ -1313,138 +1884,53 @@ class EpsonPrinter:
             "40 42 44 43 20 53 54 32 0D 0A....."
         )))
         """
-        colour_ids = {  # Ink cartridge name
-            0x01: 'Black',
-            0x03: 'Cyan',
-            0x04: 'Magenta',
-            0x05: 'Yellow',
-            0x06: 'Light Cyan',
-            0x07: 'Light Magenta',
-            0x0a: 'Light Black',
-            0x0b: 'Matte Black',
-            0x0f: 'Light Light Black',
-            0x10: 'Orange',
-            0x11: 'Green',
-        }
-
-        ink_color_ids = {  # Ink color
-            0x00: 'Black',
-            0x01: 'Cyan',
-            0x02: 'Magenta',
-            0x03: 'Yellow',
-            0x04: 'Light Cyan',
-            0x05: 'Light Magenta',
-            0x06: "Dark Yellow",
-            0x07: "Grey",
-            0x08: "Light Black",
-            0x09: "Red",
-            0x0A: "Blue",
-            0x0B: "Gloss Optimizer",
-            0x0C: "Light Grey",
-            0x0D: "Orange",
-        }
-
-        status_ids = {
-            0x00: 'Error',
-            0x01: 'Self Printing',
-            0x02: 'Busy',
-            0x03: 'Waiting',
-            0x04: 'Idle (ready to print)',
-            0x05: 'Paused',
-            0x07: 'Cleaning',
-            0x08: 'Factory shipment (not initialized)',
-            0x0a: 'Shutdown',
-            0x0f: 'Nozzle Check',
-            0x11: "Charging",
-        }
-        
-        errcode_ids = {
-            0x00: "Fatal error",
-            0x01: "Other I/F is selected",
-            0x02: "Cover Open",
-            0x04: "Paper jam",
-            0x05: "Ink out",
-            0x06: "Paper out",
-            0x0c: "Paper size or paper type or paper path error",
-            0x10: "Ink overflow error (Waste ink pad counter overflow)",
-            0x11: "Wait return from the tear-off position",
-            0x12: "Double Feed",
-            0x1a: "Cartridge cover is opened error",
-            0x1c: "Cutter error (Fatal Error)",
-            0x1d: "Cutter jam error (recoverable)",
-            0x22: "Maintenance cartridge is missing error",
-            0x25: "Rear cover is opened error",
-            0x29: "CD-R tray is out error",
-            0x2a: "Memory Card loading Error",
-            0x2B: "Tray cover is opened",
-            0x2C: "Ink cartridge overflow error",
-            0x2F: "Battery abnormal voltage error",
-            0x30: "Battery abnormal temperature error",
-            0x31: "Battery is empty error",
-            0x33: "Initial filling is impossible error",
-            0x36: "Maintenance cartridge cover is opened error",
-            0x37: "Scanner or front cover is opened error",
-            0x41: "Maintenance request",
-            0x47: "Printing disable error",
-            0x4a: "Maintenance Box near End error",
-            0x4b: "Driver mismatch error ",
-        }
-        
-        warning_ids = {
-            0x10: "Ink low (Black or Yellow)",
-            0x11: "Ink low (Magenta)",
-            0x12: "Ink low (Yellow or Cyan)",
-            0x13: "Ink low (Cyan or Matte Black)",
-            0x14: "Ink low (Photo Black)",
-            0x15: "Ink low (Red)",
-            0x16: "Ink low (Blue)",
-            0x17: "Ink low (Gloss optimizer)",
-            0x44: "Black print mode",
-            0x51: "Cleaning Disabled (Cyan)",
-            0x52: "Cleaning Disabled (Magenta)",
-            0x53: "Cleaning Disabled (Yellow)",
-            0x54: "Cleaning Disabled (Black)",
-        }
-
         if len(data) < 16:
             logging.info("status_parser: invalid packet")
             return "invalid packet"
-        if data[:11] != b'\x00@BDC ST2\r\n':
+        if not data.startswith(_ST2_HDR):
             logging.debug("Unaligned BDC ST2 header. Trying to fix...")
-            start = data.find(b'BDC ST2\r\n')
+            start = data.find(_ST2_NEEDLE)
             if start < 0:
                 logging.info(
                     "status_parser: "
                     "printer status error (must start with BDC ST2...)")
                 return "printer status error (must start with BDC ST2...)"
-            data = bytes(2) + data[start:]
+            data = _PAD2 + data[start:]
         len_p = int.from_bytes(data[11:13], byteorder='little')
         if len(data) - 13 != len_p:
             logging.info("status_parser: message error (invalid length)")
             return "message error (invalid length)"
-        buf = data[13:]
+        # walk the TLV elements by offset, without re-slicing the buffer
+        debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+        lookup_fields = self.ST2_LOOKUP_FIELDS
+        end = len(data)
+        pos = 13
         data_set = {}
-        while len(buf):
-            if len(buf) < 3:
+        while pos < end:
+            if end - pos < 3:
                 logging.info("status_parser: invalid element")
                 return "invalid element"
-            (ftype, length) = buf[:2]
-            buf = buf[2:]
-            item = buf[:length]
+            ftype = data[pos]
+            length = data[pos + 1]
+            pos += 2
+            item = data[pos:pos + length]
             if len(item) != length:
                 logging.info("status_parser: invalid element length")
                 return "invalid element length"
-            buf = buf[length:]
-            logging.debug(
-                "Processing status - ftype %s, length: %s, item: %s",
-                hex(ftype), length, item.hex(' ')
-            )
-            if ftype == 0x01:  # Status code
+            pos += length
+            if debug:
+                logging.debug(
+                    "Processing status - ftype %s, length: %s, item: %s",
+                    hex(ftype), length, item.hex(' ')
+                )
+            if ftype in lookup_fields:  # Fields decoded by table
+                name, ids = lookup_fields[ftype]
+                data_set[name] = ids.get(item, item)
+
+            elif ftype == 0x01:  # Status code
                 printer_status = item[0]
-                status_text = "unknown"
-                if printer_status in status_ids:
-                    status_text = status_ids[printer_status]
-                else:
+                status_text = self.STATUS_IDS.get(printer_status)
+                if status_text is None:
                     status_text = 'unknown: %d' % printer_status
                 if printer_status == 3 or printer_status == 4:
                     data_set["ready"] = True
@@ -1454,9 +1940,8 @@ class EpsonPrinter:
 
             elif ftype == 0x02:  # Error code
                 printer_status = item[0]
-                if printer_status in errcode_ids:
-                    data_set["errcode"] = errcode_ids[printer_status]
-                else:
+                data_set["errcode"] = self.ERRCODE_IDS.get(printer_status)
+                if data_set["errcode"] is None:
                     data_set["errcode"] = 'unknown: %d' % printer_status
 
             elif ftype == 0x03:  # Self print code
@@ -1465,27 +1950,9 @@ class EpsonPrinter:
                     data_set["self_print_code"] = "Nozzle test printing"
 
             elif ftype == 0x04:  # Warning code
-                data_set["warning_code"] = []
-                for i in item:
-                    if i in warning_ids:
-                        data_set["warning_code"].append(warning_ids[i])
-                    else:
-                        data_set["warning_code"].append('unknown: %d' % i)
-
-            elif ftype == 0x06:  # Paper path
-                data_set["paper_path"] = item
-                if item == b'\x01\xff':
-                    data_set["paper_path"] = "Cut sheet (Rear)"
-                if item == b'\x03\x01':
-                    data_set["paper_path"] = "Roll paper"
-                if item == b'\x03\x02':
-                    data_set["paper_path"] = "Photo Album"
-                if item == b'\x02\x01\x00':
-                    data_set["paper_path"] = "Cut Sheet (Auto Select)"
-                if item == b'\x02\x01':
-                    data_set["paper_path"] = "CD-R, cardboard"
-                if item == b'\x02\x01':
-                    data_set["paper_path"] = "CD-R, cardboard"
+                data_set["warning_code"] = [
+                    self.WARNING_IDS.get(i) or 'unknown: %d' % i for i in item
+                ]
 
             elif ftype == 0x07:  # Paper mismatch error
                 data_set["paper_error"] = item
@@ -1502,44 +1969,29 @@ class EpsonPrinter:
 
             elif ftype == 0x0f:  # Ink information
                 colourlen = item[0]
-                offset = 1
+                if colourlen < 3:
+                    data_set["ink_level"] = "unknown"
+                    continue
+                colour_ids = self.COLOUR_IDS.get
+                ink_color_ids = self.INK_COLOR_IDS.get
                 inks = []
-                while offset < length:
+                for offset in range(1, length, colourlen):
                     colour = item[offset]
                     ink_color = item[offset + 1]
                     level = item[offset + 2]
-                    offset += colourlen
-
-                    if colour in colour_ids:
-                        name = colour_ids[colour]
-                    else:
-                        name = "0x%X" % colour
 
-                    if ink_color in ink_color_ids:
-                        ink_name = ink_color_ids[ink_color]
-                    else:
-                        ink_name = "0x%X" % ink_color
+                    name = colour_ids(colour) or "0x%X" % colour
+                    ink_name = ink_color_ids(ink_color) or "0x%X" % ink_color
 
                     inks.append((colour, ink_color, name, ink_name, level))
 
                 data_set["ink_level"] = inks
 
             elif ftype == 0x10:  # Loading path information
-                data_set["loading_path"] = item.hex().upper()
-                if data_set["loading_path"] in [
-                        "01094E", "01084E0E4E4E014E4E", "010C4E0E4E4E084E4E"]:
+                if item in _LOADING_PATH_FIXED:
                     data_set["loading_path"] = "fixed"
-
-            elif ftype == 0x13:  # Cancel code
-                data_set["cancel_code"] = item
-                if item == b'\x01':
-                    data_set["cancel_code"] = "No request"
-                if item == b'\xA1':
-                    data_set["cancel_code"] = (
-                        "Received cancel command and printer initialization"
-                    )
-                if item == b'\x81':
-                    data_set["cancel_code"] = "Request"
+                else:
+                    data_set["loading_path"] = item.hex().upper()
 
             elif ftype == 0x14:  # Cutter information
                 try:
@@ -1549,46 +2001,17 @@ class EpsonPrinter:
                 if item == b'\x01':
                     data_set["cutter"] = "Set cutter"
 
-            elif ftype == 0x18:  # Stacker(tray) open status
-                data_set["tray_open"] = item
-                if item == b'\x02':
-                    data_set["tray_open"] = "Closed"
-                if item == b'\x03':
-                    data_set["tray_open"] = "Open"
-
             elif ftype == 0x19:  # Current job name information
                 data_set["jobname"] = item
                 if item == b'\x00\x00\x00\x00\x00unknown':
                     data_set["jobname"] = "Not defined"
 
-            elif ftype == 0x1c:  # Temperature information
-                data_set["temperature"] = item
-                if item == b'\x01':
-                    data_set["temperature"] = (
-                        "The printer temperature is higher than 40C"
-                    )
-                if item == b'\x00':
-                    data_set["temperature"] = (
-                        "The printer temperature is lower than 40C"
-                    )
-
             elif ftype == 0x1f:  # serial
                 try:
                     data_set["serial"] = item.decode()
                 except Exception:
                     data_set["serial"] = str(item)
 
-            elif ftype == 0x35:  # Paper jam error information
-                data_set["paper_jam"] = item
-                if item == b'\x00':
-                    data_set["paper_jam"] = "No jams"
-                if item == b'\x01':
-                    data_set["paper_jam"] = "Paper jammed at ejecting"
-                if item == b'\x02':
-                    data_set["paper_jam"] = "Paper jam in rear ASF or no feed"
-                if item == b'\x80':
-                    data_set["paper_jam"] = "No papers at rear ASF"
-
             elif ftype == 0x36:  # Paper count information
                 if length != 20:
                     data_set["paper_count"] = "error"
@@ -1634,17 +2057,6 @@ class EpsonPrinter:
                             i + 1]
                     j += 1
 
-            elif ftype == 0x3d:  # Printer I/F status
-                data_set["interface_status"] = item
-                if item == b'\x00':
-                    data_set["interface_status"] = (
-                        "Available to accept data and reply"
-                    )
-                if item == b'\x01':
-                    data_set["interface_status"] = (
-                        "Not available to accept data"
-                    )
-
             elif ftype == 0x40:  # Serial No. information
                 try:
                     data_set["serial_number_info"] = item.decode()
@@ -1684,12 +2096,18 @@ class EpsonPrinter:
             snmp_info = {mib_name: oids[mib_name]}
         else:
             snmp_info = oids
-        for name, oid in snmp_info.items():
+        names = list(snmp_info)
+        responses = self.snmp_mib_many_cached(
+            [snmp_info[name] for name in names],
+            self.status_cache_ttl,
+            label=["get_snmp_info " + name for name in names]
+        )
+        for name, (tag, result) in zip(names, responses):
+            oid = snmp_info[name]
             logging.debug(
                 f"SNMP_DUMP {name}:\n"
                 f"  ADDRESS: {oid}"
             )
-            tag, result = self.snmp_mib(oid, label="get_snmp_info " + name)
             logging.debug("  TAG: %s\n  RESPONSE: %s", tag, repr(result))
 
             if name == "Power Off Timer" and result and result.find(
@@ -1731,20 +2149,20 @@ class EpsonPrinter:
         if isinstance(self.parm["serial_number"], (list, tuple)):
             left_val = None
             for i in self.parm["serial_number"]:
-                val = "".join(
-                    chr(int(value or "0x3f", 16))  # "0x3f" --> "?"
+                val = bytes.fromhex("".join(
+                    value or "3f"  # "3f" --> "?"
                     for value in self.read_eeprom_many(i, label="serial_number")
-                )
+                )).decode("latin-1")
                 if left_val is not None and val != left_val:
                     return False
                 left_val = val
             return left_val
         else:
-            return "".join(
-                chr(int(value or "0x3f", 16))  # "0x3f" --> "?"
+            return bytes.fromhex("".join(
+                value or "3f"  # "3f" --> "?"
                 for value in self.read_eeprom_many(
                     self.parm["serial_number"], label="serial_number")
-            )
+            )).decode("latin-1")
 
     def get_printer_brand(self) -> str:
         """Return the producer name of the printer ("EPSON")."""
@@ -1753,12 +2171,12 @@ class EpsonPrinter:
             return None
         if "brand_name" not in self.parm:
             return None
-        return ''.join(
-            [chr(int(i or "0x3f", 16))
+        return bytes.fromhex(''.join(
+            i or "3f"  # "3f" --> "?"
             for i in self.read_eeprom_many(
                 self.parm["brand_name"], label="get_brand_name"
-            ) if i != '00']
-        )
+            )
+        )).replace(b'\x00', b'').decode("latin-1")
 
     def get_printer_model(self) -> str:
         """Return the model name of the printer."""
@@ -1767,12 +2185,12 @@ class EpsonPrinter:
             return None
         if "model_name" not in self.parm:
             return None
-        return ''.join(
-            [chr(int(i or "0x3f", 16))
+        return bytes.fromhex(''.join(
+            i or "3f"  # "3f" --> "?"
             for i in self.read_eeprom_many(
                 self.parm["model_name"], label="get_model_name"
-            ) if i != '00']
-        )
+            )
+        )).replace(b'\x00', b'').decode("latin-1")
 
     def get_wifi_mac_address(self) -> str:
         """Return the WiFi MAC address of the printer."""
@@ -1801,15 +2219,22 @@ class EpsonPrinter:
             stat_info = {stat_name: self.parm["stats"][stat_name]}
         else:
             stat_info = self.parm["stats"]
+        # read the addresses of all the statistics at once
+        stat_oids = {
+            stat_name: list(oids) for stat_name, oids in stat_info.items()
+        }
+        all_values = self.read_eeprom_batch(
+            chain.from_iterable(stat_oids.values()), label="get_stats")
         stats_result = {}
-        for stat_name, oids in stat_info.items():
-            total = 0
-            for val in self.read_eeprom_many(oids, label=stat_name):
-                if val is None:
-                    total = None
-                    break
-                else:
-                    total = (total << 8) + int(val, 16)
+        first = 0
+        for stat_name, oids in stat_oids.items():
+            values = all_values[first:first + len(oids)]
+            first += len(oids)
+            if None in values:
+                total = None
+            else:
+                total = int.from_bytes(
+                    bytes.fromhex("".join(values)), byteorder="big")
             stats_result[stat_name] = total
             if stat_name == "MAC Address" and total != None:
                 stats_result[stat_name] = total.to_bytes(
@@ -1818,11 +2243,10 @@ class EpsonPrinter:
             return stats_result
         ftrt = stats_result["First TI received time"]
         try:
-            year = 2000 + ftrt // (16 * 32)
-            month = (ftrt - (year - 2000) * (16 * 32)) // 32
-            day = ftrt - (year - 2000) * 16 * 32 - 32 * month
+            year, month_day = divmod(ftrt, 16 * 32)
+            month, day = divmod(month_day, 32)
             stats_result["First TI received time"] = datetime.datetime(
-                year, month, day).strftime('%d %b %Y')
+                2000 + year, month, day).strftime('%d %b %Y')
         except Exception:
             stats_result["First TI received time"] = "?"
         return stats_result
@@ -1855,7 +2279,9 @@ class EpsonPrinter:
             f"SNMP_DUMP {label}:\n"
             f"  ADDRESS: {oid}"
         )
-        tag, firmware_string = self.snmp_mib(oid, label=label)
+        tag, firmware_string = self.snmp_mib_cached(
+            oid, self.static_cache_ttl, label=label
+        )
         if not firmware_string:
             return None
         if self.invalid_response(firmware_string):
@@ -1864,12 +2290,15 @@ class EpsonPrinter:
                 label, repr(firmware_string)
             )
         logging.debug("  TAG: %s\n  RESPONSE: %s", tag, repr(firmware_string))
-        firmware = re.sub(
-            r".*vi:00:(.{6}).*", r'\g<1>', firmware_string.decode())
-        year = ord(firmware[4:5]) + 1945
+        start = firmware_string.find(b"vi:00:") + 6
+        firmware = firmware_string[start:start + 6]
+        if start < 6 or len(firmware) != 6:
+            logging.info("%s: missing firmware version", label)
+            return None
+        year = firmware[4] + 1945
         month = int(firmware[5:], 16)
         day = int(firmware[2:4])
-        return firmware + " " + datetime.datetime(
+        return firmware.decode() + " " + datetime.datetime(
             year, month, day).strftime('%d %b %Y')
 
     def get_cartridges(self) -> str:
@@ -1880,7 +2309,9 @@ class EpsonPrinter:
             f"SNMP_DUMP {label}:\n"
             f"  ADDRESS: {oid}"
         )
-        tag, cartridges_string = self.snmp_mib(oid, label=label)
+        tag, cartridges_string = self.snmp_mib_cached(
+            oid, self.static_cache_ttl, label=label
+        )
         if self.invalid_response(cartridges_string):
             logging.error(
                 f"Invalid response for %s: '%s'",
@@ -1890,11 +2321,12 @@ class EpsonPrinter:
             return None
         logging.debug(
             "  TAG: %s\n  RESPONSE: %s", tag, repr(cartridges_string))
-        cartridges = re.sub(
-            r".*IA:00;(.*);.*", r'\g<1>',
-            cartridges_string.decode(),
-            flags=re.S
-        )
+        start = cartridges_string.find(b"IA:00;") + 6
+        end = cartridges_string.rfind(b";")
+        if start < 6 or end < start:
+            logging.info("%s: missing cartridge list", label)
+            return None
+        cartridges = cartridges_string[start:end].decode()
         return [i.strip() for i in cartridges.split(',')]
 
     def get_ink_replacement_counters(self) -> str:
@@ -1904,18 +2336,19 @@ class EpsonPrinter:
             return None
         if "ink_replacement_counters" not in self.parm:
             return None
-        irc = {
-            (
-                color,
-                counter,
-                int(
-                    self.read_eeprom(
-                        value, label="ink_replacement_counters") or "-1", 16
-                ),
-            )
+        counters = [
+            (color, counter, value)
             for color, data in self.parm[
                 "ink_replacement_counters"].items()
             for counter, value in data.items()
+        ]
+        values = self.read_eeprom_batch(
+            [value for color, counter, value in counters],
+            label="ink_replacement_counters"
+        )
+        irc = {
+            (color, counter, _HEX_LUT.get(value, -1))
+            for (color, counter, oid), value in zip(counters, values)
         }
         return irc
 
@@ -1927,18 +2360,21 @@ class EpsonPrinter:
         """
         address = f"{self.EEPROM_LINK}.115.116.1.0.1"  # 73 74 01 00 01
         logging.debug(f"PRINTER_STATUS:\n  ADDRESS: {address}")
-        tag, result = self.snmp_mib(address, label="get_printer_status")
+        tag, result = self.snmp_mib_cached(
+            address, self.status_cache_ttl, label="get_printer_status"
+        )
         if not result:
             return None
-        logging.debug("  TAG: %s\n  RESPONSE: %s...\n%s",
-            tag,
-            repr(result[:20]),
-            textwrap.fill(
-                result.hex(' '),
-                initial_indent="    ",
-                subsequent_indent="    ",
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("  TAG: %s\n  RESPONSE: %s...\n%s",
+                tag,
+                repr(result[:20]),
+                textwrap.fill(
+                    result.hex(' '),
+                    initial_indent="    ",
+                    subsequent_indent="    ",
+                )
             )
-        )
         return self.status_parser(result)
 
     def get_waste_ink_levels(self):
@@ -1948,18 +2384,26 @@ class EpsonPrinter:
             return None
         if "main_waste" not in self.parm:
             return None
+        wastes = {
+            waste_type: self.parm[waste_type]
+            for waste_type in _WASTE_TYPES
+            if waste_type in self.parm
+        }
+        # read the counters of all the waste types at once
+        levels = self.read_eeprom_batch(
+            chain.from_iterable(waste["oids"] for waste in wastes.values()),
+            label="get_waste_ink_levels"
+        )
+        if None in levels:
+            return None
         results = {}
-        for waste_type in ["main_waste", "borderless_waste", "first_waste",
-                "second_waste", "third_waste"]:
-            if waste_type not in self.parm:
-                continue
-            level = self.read_eeprom_many(
-                self.parm[waste_type]["oids"], label=waste_type)
-            if level == [None]:
-                return None
-            level_b10 = int("".join(reversed(level)), 16)
-            results[waste_type] = round(
-                level_b10 / self.parm[waste_type]["divider"], 2)
+        first = 0
+        for waste_type, waste in wastes.items():
+            level = levels[first:first + len(waste["oids"])]
+            first += len(waste["oids"])
+            level_b10 = int.from_bytes(
+                bytes.fromhex("".join(level)), byteorder="little")
+            results[waste_type] = round(level_b10 / waste["divider"], 2)
         return results
 
     def get_last_printer_fatal_errors(self) -> list:
@@ -1980,15 +2424,21 @@ class EpsonPrinter:
     def get_cartridge_information(self) -> str:
         """Return list of cartridge properties."""
         response = []
-        for i in range(1, 9):
-            mib = f"{self.EEPROM_LINK}.105.105.2.0.1." + str(i)  # 69 69 02 00 01
+        mibs = {
+            i: f"{self.EEPROM_LINK}.105.105.2.0.1." + str(i)  # 69 69 02 00 01
+            for i in range(1, 9)
+        }
+        if self.mib_dict:  # only cartridges included in the configuration
+            mibs = {i: mib for i, mib in mibs.items() if mib in self.mib_dict}
+        # all cartridges are queried at once; stop at the first missing one
+        cartridges = self.snmp_mib_many(
+            mibs.values(), label="get_cartridge_information"
+        )
+        for (i, mib), (tag, cartridge) in zip(mibs.items(), cartridges):
             logging.debug(
                 f"Cartridge {i}:\n"
                 f"  ADDRESS: {mib}"
             )
-            tag, cartridge = self.snmp_mib(
-                mib, label="get_cartridge_information"
-            )
             logging.debug("  TAG: %s\n  RESPONSE: %s", tag, repr(cartridge))
             if not cartridge:
                 continue
@@ -2025,21 +2475,22 @@ class EpsonPrinter:
             cartridge[cartridge.find(b'@BDC PS\r\n') + 9
                 :
                 -2 if cartridge[-1] == 12 else -1]
-                .decode()
-                .split(';')
+                .split(b';')
             for cartridge in cartridges
         ]
         if not response:
             return None
-        try:
-            cartridges = [
-                {i[0]: i[1] for i in map(lambda x: x.split(':'), j)}
-                    for j in response
-            ]
-        except Exception as e:
-            logging.error("Cartridge map error: %s", e)
-            return None
-        if logging.getLogger().level <= logging.DEBUG:
+        cartridges = []
+        for j in response:
+            fields = {}
+            for field in j:
+                key, sep, value = field.partition(b':')
+                if not sep:
+                    logging.error("Cartridge map error: %s", repr(field))
+                    return None
+                fields[key.decode()] = value  # values are kept as bytes
+            cartridges.append(fields)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
             for i in cartridges:
                 logging.debug("Raw cartridge information:")
                 for j in i:
@@ -2049,54 +2500,60 @@ class EpsonPrinter:
                             value = str(int(i[j], 16))
                         except Exception:
                             pass
-                    if i[j] == "NAVL":
+                    if i[j] == b"NAVL":
                         value = "(Not available)"
                     logging.debug(
                         "  %s = %s %s",
-                        j.rjust(4), i[j].rjust(4), value.rjust(4)
+                        j.rjust(4),
+                        i[j].decode(errors="replace").rjust(4),
+                        value.rjust(4)
                     )
+        missing = "Not available"
+        cartridge_list = []
         try:
-            missing = "Not available"
-            return [
-                {
-                    k: v for k, v in 
-                        {
-                            "ink_color": self.ink_color(int(i['IC1'], 16))
-                                if 'IC1' in i else missing,
-                            "ink_quantity": int(i['IQT'], 16)
-                                if 'IQT' in i else missing,
-                            "production_year": int(i['PDY'], 16) + (
-                                1900 if int(i['PDY'], 16) > 80 else 2000)
-                                if 'PDY' in i else missing,
-                            "production_month": int(i['PDM'], 16)
-                                if 'PDM' in i else missing,
-                            "data": i.get('SID').strip()
-                                if 'SID' in i else missing,
-                            "manufacturer": i.get('LOG').strip()
-                                if 'LOG' in i else missing,
-                        }.items()
-                    if v  # exclude items without value
-                } if 'II' in i and i['II'] == '03' else {
-                    "Ink Information": f"Unknown {i['II']}"
-                        if 'II' in i and i['II'] != '00' else missing
+            for i in cartridges:
+                if i.get('II') != b'03':
+                    cartridge_list.append({
+                        "Ink Information": f"Unknown {i['II'].decode()}"
+                            if 'II' in i and i['II'] != b'00' else missing
+                    })
+                    continue
+                year = int(i['PDY'], 16) if 'PDY' in i else None
+                cartridge = {
+                    "ink_color": self.ink_color(int(i['IC1'], 16))
+                        if 'IC1' in i else missing,
+                    "ink_quantity": int(i['IQT'], 16)
+                        if 'IQT' in i else missing,
+                    "production_year": year + (1900 if year > 80 else 2000)
+                        if year is not None else missing,
+                    "production_month": int(i['PDM'], 16)
+                        if 'PDM' in i else missing,
+                    "data": i['SID'].strip().decode()
+                        if 'SID' in i else missing,
+                    "manufacturer": i['LOG'].strip().decode()
+                        if 'LOG' in i else missing,
                 }
-                for i in cartridges
-            ]
+                cartridge_list.append({
+                    k: v for k, v in cartridge.items()
+                        if v  # exclude items without value
+                })
         except Exception as e:
             logging.error("Cartridge value error: %s.\n%s", e, cartridges)
             return None
+        return cartridge_list
 
     def dump_eeprom(self, start: int = 0, end: int = 0xFF):
         """
         Dump EEPROM data from start to end (less significant byte).
+        Addresses are queried again at each dump, unless eeprom_cache_ttl
+        is set (see read_eeprom_batch).
         """
-        d = {}
-        for oid in range(start, end + 1):
-            d[oid] = int(
-                self.read_eeprom(oid, label="dump_eeprom") or "-0x1",
-                16
-            )
-        return d
+        oids = range(start, end + 1)
+        return {
+            oid: _HEX_LUT.get(value, -1)
+            for oid, value in zip(
+                oids, self.read_eeprom_batch(oids, label="dump_eeprom"))
+        }
 
     def update_parameter(
         self,
@@ -2111,41 +2568,27 @@ class EpsonPrinter:
         if not self.parm:
             logging.error("EpsonPrinter - invalid API usage")
             return None
-        if (
-            not parameter
-            or parameter not in self.parm
-            or not self.parm[parameter]
-            or not value_list
-            or not len(value_list)
-            or (
-                isinstance(self.parm[parameter], (list, tuple))
-                and not all(
-                    len(sublist) == len(value_list)
-                    for sublist in self.parm[parameter]
-                )
-            )
-            or (
-                not isinstance(self.parm[parameter], (list, tuple))
-                and len(self.parm[parameter]) != len(value_list)
-            )
-        ):
+        if not parameter or not value_list:
+            return None
+        oids = self.parm.get(parameter)
+        if not oids:
+            return None
+        if isinstance(oids, (list, tuple)):
+            for sublist in oids:
+                if len(sublist) != len(value_list):
+                    return None
+        elif len(oids) != len(value_list):
             return None
         if dry_run:
             return True
-        if isinstance(self.parm[parameter], (list, tuple)):
-            for i in self.parm[parameter]:
-                for oid, value in zip(i, value_list):
-                    if not self.write_eeprom(
-                        oid, value, label="update_" + parameter
-                    ):
-                        return False
-                    return True
-            return False
-        for oid, value in zip(self.parm[parameter], value_list):
-            if not self.write_eeprom(oid, value, label="update_" + parameter):
+        if not isinstance(oids, (list, tuple)):
+            oids = [oids]
+        for sublist in oids:
+            if not self.write_eeprom_many(
+                zip(sublist, value_list), label="update_" + parameter
+            ):
                 return False
-            return True
-        return False
+        return True
 
     def reset_waste_ink_levels(self, dry_run=False) -> bool:
         """
@@ -2157,23 +2600,22 @@ class EpsonPrinter:
         if "raw_waste_reset" in self.parm:
             if dry_run:
                 return True
-            for oid, value in self.parm["raw_waste_reset"].items():
-                if not self.write_eeprom(oid, value, label="raw_waste_reset"):
-                    return False
-            return True
+            return self.write_eeprom_many(
+                self.parm["raw_waste_reset"].items(), label="raw_waste_reset")
         if "main_waste" not in self.parm:
             return None
         if dry_run:
             return True
-        for oid in self.parm["main_waste"]["oids"]:
-            if not self.write_eeprom(oid, 0, label="main_waste"):
-                return False
+        if not self.write_eeprom_many(
+                [(oid, 0) for oid in self.parm["main_waste"]["oids"]],
+                label="main_waste"):
+            return False
         if "borderless_waste" not in self.parm:
             return True
-        for oid in self.parm["borderless_waste"]["oids"]:
-            if not self.write_eeprom(oid, 0, label="borderless_waste"):
-                return False
-        return True
+        return self.write_eeprom_many(
+            [(oid, 0) for oid in self.parm["borderless_waste"]["oids"]],
+            label="borderless_waste"
+        )
 
     def write_first_ti_received_time(
             self, year: int, month: int, day: int) -> bool:
@@ -2187,15 +2629,14 @@ class EpsonPrinter:
         except KeyError:
             logging.info("write_first_ti_received_time: missing parameter")
             return False
-        n = (year - 2000) * 16 * 32 + 32 * month + day
+        n = ((year - 2000) << 9) | (month << 5) | day  # 7-4-5 bits
+        msb_value, lsb_value = n >> 8, n & 0xFF
         logging.debug(
-            "FTRT: %s %s = %s %s",
-            hex(n // 256), hex(n % 256), n // 256, n % 256)
-        if not self.write_eeprom(msb, n // 256, label="First TI received time"):
-            return False
-        if not self.write_eeprom(lsb, n % 256, label="First TI received time"):
-            return False
-        return True
+            "FTRT: %#x %#x = %d %d", msb_value, lsb_value, msb_value, lsb_value)
+        return self.write_eeprom_many(
+            [(msb, msb_value), (lsb, lsb_value)],
+            label="First TI received time"
+        )
 
     def write_poweroff_timer(self, mins: int) -> bool:
         """Update power-off timer"""
@@ -2208,18 +2649,15 @@ class EpsonPrinter:
         except KeyError:
             logging.info("write_poweroff_timer: missing parameter")
             return False
+        msb_value, lsb_value = mins >> 8, mins & 0xFF
         logging.debug(
-            "poweroff: %s %s = %s %s",
-            hex(mins // 256), hex(mins % 256), mins // 256, mins % 256)
-        if not self.write_eeprom(
-            msb, mins // 256, label="Write power off timer"
-        ):
-            return False
-        if not self.write_eeprom(
-            lsb, mins % 256, label="Write power off timer"
-        ):
-            return False
-        return True
+            "poweroff: %#x %#x = %d %d",
+            msb_value, lsb_value, msb_value, lsb_value
+        )
+        return self.write_eeprom_many(
+            [(msb, msb_value), (lsb, lsb_value)],
+            label="Write power off timer"
+        )
 
     def list_known_keys(self):
         """ List all known read and write keys for all defined printers. """
@@ -2240,18 +2678,54 @@ class EpsonPrinter:
         return known_keys
 
     def brute_force_read_key(self, minimum: int = 0x00, maximum: int = 0xFF):
-        """Brute force read_key for printer."""
+        """
+        Brute force read_key for printer.
+        The read keys of the defined printers are tried first, then all
+        the other pairs of distinct values between minimum and maximum.
+        Each SNMP query probes up to oid_batch_size keys.
+        """
         if not self.parm:
             logging.error("EpsonPrinter - invalid API usage")
             return None
-        for x, y in itertools.permutations(range(minimum, maximum + 1), r=2):
-            self.parm['read_key'] = [x, y]
-            logging.warning(f"Trying {self.parm['read_key']}...")
-            val = self.read_eeprom(0x00, label="brute_force_read_key")
-            if val is None:
-                continue
-            return self.parm['read_key']
-        return None
+        label = "brute_force_read_key"
+        values = range(minimum, maximum + 1)
+        known_keys = [
+            key for key in dict.fromkeys(
+                tuple(v['read_key']) for v in self.PRINTER_CONFIG.values()
+                if isinstance(v.get('read_key'), (list, tuple))
+                and len(v['read_key']) == 2
+            )
+            if key[0] in values and key[1] in values
+        ]
+        known_set = set(known_keys)
+        candidates = itertools.chain(
+            known_keys,
+            (
+                key for key in itertools.permutations(values, r=2)
+                if key not in known_set
+            )
+        )
+        batch_size = max(1, self.oid_batch_size)
+        while True:
+            batch = list(itertools.islice(candidates, batch_size))
+            if not batch:
+                return None
+            oids = []
+            for key in batch:
+                self.parm['read_key'] = list(key)
+                logging.warning(f"Trying {self.parm['read_key']}...")
+                oids.append(self.eeprom_oid_read_address(0x00, label=label))
+            responses = self.snmp_mib_many(oids, label=label)
+            for key, (tag, response) in zip(batch, responses):
+                if (
+                    not response
+                    or self.invalid_response(response)
+                    or b"EE:0000" not in response
+                ):
+                    continue
+                self.parm['read_key'] = list(key)
+                if self.read_eeprom(0x00, label=label) is not None:
+                    return self.parm['read_key']
 
     def find_serial_number(self, eeprom_range):
         """
@@ -2262,48 +2736,58 @@ class EpsonPrinter:
         hex_bytes = self.read_eeprom_many(
             eeprom_range, label="detect_serial_number"
         )
-        # Convert the hex bytes to characters
-        sequence = ''.join(chr(int(byte, 16)) for byte in hex_bytes)
-        # Serial number pattern (10 consecutive uppercase letters or digits)
-        serial_number_pattern = r'[A-Z0-9]{10}'
+        if not hex_bytes or hex_bytes == [None]:
+            return hex_bytes, []
+        # Convert the hex bytes to characters (latin-1 maps each byte to
+        # the character with the same code)
+        sequence = bytes.fromhex("".join(hex_bytes)).decode("latin-1")
         # Find all matches
-        return hex_bytes, list(re.finditer(serial_number_pattern, sequence))
+        return hex_bytes, list(_SERIAL_NUMBER_RE.finditer(sequence))
 
     def write_key_list(self, read_key):
         """ Produce a list of distinct write_key prioritizing ones with same read_key """
-        write_key_list = []
+        # dict keys keep the insertion order and drop duplicates
+        same_read_key = {}
+        other_read_key = {}
         for p, v in self.PRINTER_CONFIG.items():
-            if (
-                'read_key' in v
-                and v['read_key'] == read_key
-                and 'write_key' in v
-                and v['write_key'] not in write_key_list
-            ):
-                write_key_list.append(v['write_key'])
-        for p, v in self.PRINTER_CONFIG.items():
-            if (
-                'write_key' in v
-                and v['write_key'] not in write_key_list
-            ):
-                write_key_list.append(v['write_key'])
-        return write_key_list
+            if 'write_key' not in v:
+                continue
+            if 'read_key' in v and v['read_key'] == read_key:
+                same_read_key[v['write_key']] = None
+            else:
+                other_read_key[v['write_key']] = None
+        return list(same_read_key) + [
+            write_key for write_key in other_read_key
+            if write_key not in same_read_key
+        ]
 
-    def validate_write_key(self, addr, value, label):
-        """ Validate write_key by writing values to the EEPROM """
+    def validate_write_key(self, addr, value, label, verify=True):
+        """
+        Validate write_key by writing values to the EEPROM.
+        With verify=False, the restored value is not read back.
+        """
         if not self.write_eeprom(addr, value + 1, label=label):  # test write
             return None
-        ret_value = int(self.read_eeprom(addr), 16)
-        if not self.write_eeprom(addr, value, label=label):  # restore previous value
+        ret_value = self.read_eeprom(addr)
+        if ret_value is None:
             return None
-        if int(self.read_eeprom(addr), 16) != value:
+        ret_value = int(ret_value, 16)
+        if ret_value == value:  # unchanged, nothing to restore
+            return False
+        if not self.write_eeprom(addr, value, label=label):  # restore previous value
             return None
+        if verify:
+            restored_value = self.read_eeprom(addr)
+            if restored_value is None or int(restored_value, 16) != value:
+                return None
         return ret_value == value + 1
 
     def write_sequence_to_string(self, write_sequence):
         """ Convert write key sequence to string """
         try:
-            int_sequence = [int(b) for b in write_sequence[0].split(".")]
-            return "".join([chr(b-1) for b in int_sequence])
+            return bytes(
+                int(b) - 1 for b in write_sequence[0].split(".")
+            ).decode("latin-1")
         except Exception:
             return None
 
@@ -2314,142 +2798,104 @@ class EpsonPrinter:
         dictionary, which is used in place of the SNMP query, simulating them
         instead of accessing the printer via SNMP.
         """
-        class NextLine:
-            def __init__(self, file):
-                self.next_line = None
-                self.recursion = 0
-                self.file = file
-
-            def readline(self):
-                next_line = self.next_line
-                if self.next_line != None and self.recursion < 2:
-                    self.next_line = None
-                    return next_line
-                if next_line != None:
-                    logginf.error("Recursion error: '%s'", next_line)
-                self.next_line = None
-                self.recursion = 0
-                return next(self.file)
-
-            def pushline(self, line):
-                if self.next_line != None:
-                    logginf.error(
-                        "Line already pushed: '%s', '%s'",
-                        self.next_line, line
-                    )
-                self.next_line = line
-                self.recursion += 1
-        
+        lines = list(file)  # read the whole file at once
+        pos = 0  # index of the next line to read
+        last = 0  # index of the last line read
+
+        def readline():
+            nonlocal pos, last
+            if pos >= len(lines):
+                raise StopIteration
+            last = pos
+            pos += 1
+            return lines[last]
+
+        def pushline():
+            """Push back the last line read, so that it is read again."""
+            nonlocal pos
+            pos = last
+
         mib_dict = {}
-        next_line = NextLine(file)
         process = False
         try:
             while True:
-                line = next_line.readline()
-                oid = None
-                value = None
-                process = None
+                line = readline()
                 address_val = None
                 response_val = None
                 tag_val = None
                 response_val_bytes = None
-                if line.startswith("PRINTER_STATUS:"):
-                    oid = False
-                    value = False
-                    process = True
-                    response_next = True
-                if line.startswith("Cartridge "):
-                    oid = False
-                    value = False
-                    process = True
-                    response_next = False
-                if line.startswith("SNMP_DUMP "):
-                    oid = False
-                    value = False
-                    process = True
-                    response_next = False
-                if line.startswith("EEPROM_DUMP "):
-                    oid = True
-                    value = False
-                    process = True
-                    response_next = False
-                if line.startswith("EEPROM_WRITE "):
-                    oid = True
-                    value = True
-                    process = True
-                    response_next = False
+                record = _CONFIG_RECORD_RE.match(line)
+                process = record is not None
                 if process:
+                    oid, value, response_next = _CONFIG_RECORDS[
+                        record.group()]
                     # address
-                    address_line = next_line.readline()
+                    address_line = readline()
                     if not address_line.startswith("  ADDRESS: "):
                         logging.error(
                             "Missing ADDRESS: '%s'", address_line.rstrip())
-                        next_line.pushline(address_line)
+                        pushline()
                         continue
                     address_val = address_line[11:].rstrip()
                     if not address_val:
                         logging.error(
                             "Invalid ADDRESS: '%s'", address_line.rstrip())
-                        next_line.pushline(address_line)
+                        pushline()
                         continue
                     # oid
                     if oid:
-                        oid_line = next_line.readline()
+                        oid_line = readline()
                         if not oid_line.startswith("  OID: "):
                             logging.error(
                                 "Missing OID: '%s'", oid_line.rstrip())
-                            next_line.pushline(oid_line)
+                            pushline()
                             continue
                     # value
                     if value:
-                        value_line = next_line.readline()
+                        value_line = readline()
                         if not value_line.startswith("  VALUE: "):
                             logging.error(
                                 "Missing VALUE: '%s'", value_line.rstrip())
-                            next_line.pushline(value_line)
+                            pushline()
                             continue
                     # tag
-                    tag_line = next_line.readline()
+                    tag_line = readline()
                     if tag_line.startswith("  TAG: "):
                         tag_val = tag_line[7:].rstrip()
                     if not tag_val:
                         logging.error(
                             "Invalid TAG '%s'", tag_line.rstrip())
-                        next_line.pushline(tag_line)
+                        pushline()
                         continue
                     # response
-                    response_line = next_line.readline()
+                    response_line = readline()
                     if response_line.startswith("  RESPONSE: "):
                         response_val = response_line[12:].rstrip()
                     if not response_val:
                         logging.error(
                             "Invalid RESPONSE '%s'", response_line.rstrip())
-                        next_line.pushline(response_line)
+                        pushline()
                         continue
                     if response_next:
-                        dump_hex_str = ""
+                        dump_hex_lines = []
                         while True:
-                            dump_hex = next_line.readline()
+                            dump_hex = readline()
                             if not dump_hex.startswith("    "):
-                                next_line.pushline(dump_hex)
+                                pushline()
                                 break
-                            try:
-                                val = bytes.fromhex(dump_hex)
-                            except ValueError:
-                                next_line.pushline(dump_hex)
-                                continue
-                            dump_hex_str += dump_hex
+                            dump_hex_lines.append(dump_hex)
+                        dump_hex_str = "".join(dump_hex_lines)
                         if not dump_hex_str:
                             logging.error(
                                 "Invalid DUMP: '%s'", dump_hex.rstrip())
-                            next_line.pushline(dump_hex)
+                            pushline()
                             continue
                         try:
                             val = bytes.fromhex(dump_hex_str)
                         except ValueError:
                             logging.error(
                                 "Invalid DUMP %s", dump_hex_str.rstrip())
-                            next_line.pushline(dump_hex)
+                            pushline()
                             continue
                         if val:
                             mib_dict[address_val] = tag_val, val
@@ -2463,7 +2909,7 @@ class EpsonPrinter:
                                 response_line.rstrip(),
                                 e
                             )
-                            next_line.pushline(response_line)
+                            pushline()
                             continue
                         if response_val_bytes:
                             mib_dict[address_val] = tag_val, response_val_bytes
@@ -2472,7 +2918,7 @@ class EpsonPrinter:
                                 "Null value for response %s",
                                 response_line.rstrip()
                             )
-                            next_line.pushline(response_line)
+                            pushline()
         except StopIteration:
             pass
         if process:
@@ -2492,10 +2938,12 @@ class EpsonPrinter:
             "Integer": "2",
         }
         try:
+            write_lines = []
             for key, (tag, value) in self.mib_dict.items():
                 if tag == "OctetString":
                     if isinstance(value, bytes):
-                        write_line = f"{key}|{tagnum[tag]}|{value.hex()}\n"
+                        write_lines.append(
+                            f"{key}|{tagnum[tag]}|{value.hex()}\n")
                     else:
                         logging.error(
                             "OctetString is not byte type: key=%s, tag=%s, "
@@ -2504,8 +2952,8 @@ class EpsonPrinter:
                         )
                         continue
                 else:
-                    write_line = f"{key}|{tagnum[tag]}|{value}\n"
-                file.write(write_line)
+                    write_lines.append(f"{key}|{tagnum[tag]}|{value}\n")
+            file.write("".join(write_lines))
             file.close()
         except Exception as e:
             logging.error("simdata write error: %s", e)
@@ -2513,33 +2961,32 @@ class EpsonPrinter:
         return True
 
 
+EpsonPrinter.expand_printer_conf(EpsonPrinter.PRINTER_CONFIG)
+
+
 def get_printer_models(input_string):
     # Tokenize the string
-    tokens = re.split(" |/", input_string)
+    tokens = _MODEL_SPLIT_RE.split(input_string)
     if not len(tokens):
         return []
 
-    # Define the words to remove (uppercase, then case insensitive)
-    remove_tokens = {"EPSON", "SERIES"}
-
     # Process tokens
     processed_tokens = []
     non_numeric_part = ""
     pre_model = ""
     for token in tokens:
-        upper_token = token.upper()
-
-        # Remove tokens that match remove_tokens
-        if any(word == upper_token for word in remove_tokens):
+        # Remove the words to remove (case insensitive)
+        if token.upper() in _MODEL_REMOVE_TOKENS:
             continue
         if not any(char.isdigit() for char in token):  # no alphanum inside
             pre_model = pre_model + token + " "
             continue
+        is_numeric = token.isnumeric()
         # Identify the non-numeric part of the first token
-        if not token.isnumeric() and not non_numeric_part:
+        if not is_numeric and not non_numeric_part:
             non_numeric_part = "".join(c for c in token if not c.isdigit())
         # if token is numeric, prepend the non-numeric part
-        if token.isnumeric():
+        if is_numeric:
             processed_tokens.append(f"{pre_model}{non_numeric_part}{token}")
         else:
             processed_tokens.append(f"{pre_model}{token}")
@@ -2690,6 +3137,14 @@ if __name__ == "__main__":
         default=None,
         help='SNMP GET retries (floating point argument)',
     )
+    parser.add_argument(
+        '--batch-size',
+        dest='oid_batch_size',
+        type=auto_int,
+        default=None,
+        help='Max number of OIDs in a single SNMP request (default is 8;'
+        ' use 1 if the printer rejects multiple OIDs)',
+    )
     parser.add_argument(
         '-c',
         "--config",
@@ -2740,6 +3195,8 @@ if __name__ == "__main__":
     if value:
         path = value
     if os.path.exists(path):
+        import yaml
+        import logging.config
         with open(path, 'rt') as f:
             config = yaml.safe_load(f.read())
         try:
@@ -2755,6 +3212,7 @@ if __name__ == "__main__":
 
     conf_dict = {}
     if args.pickle:
+        import pickle
         try:
             conf_dict = pickle.load(args.pickle[0])
         except Exception as e:
@@ -2769,7 +3227,8 @@ if __name__ == "__main__":
         port=args.port,
         timeout=args.timeout,
         retries=args.retries,
-        dry_run=args.dry_run)
+        dry_run=args.dry_run,
+        oid_batch_size=args.oid_batch_size)
     if args.config_file:
         if not printer.read_config_file(args.config_file[0]):
             print("Error while reading configuration file")
@@ -2831,15 +3290,17 @@ if __name__ == "__main__":
                 )
         if args.dump_eeprom:
             print_opt = True
-            for addr, val in printer.dump_eeprom(
-                        int(ast.literal_eval(args.dump_eeprom[0])),
-                        int(ast.literal_eval(args.dump_eeprom[1]))
-                    ).items():
-                print(
-                    f"EEPROM_ADDR {hex(addr).rjust(4)} = "
-                    f"{str(addr).rjust(3)}: "
-                    f"{val:#04x} = {str(val).rjust(3)}"
-                )
+            dump_lines = [
+                f"EEPROM_ADDR {hex(addr).rjust(4)} = "
+                f"{str(addr).rjust(3)}: "
+                f"{val:#04x} = {str(val).rjust(3)}"
+                for addr, val in printer.dump_eeprom(
+                    int(args.dump_eeprom[0], 0),
+                    int(args.dump_eeprom[1], 0)
+                ).items()
+            ]
+            if dump_lines:
+                print("\n".join(dump_lines))
         if args.query:
             print_opt = True
             if ("stats" in printer.parm and
@@ -2894,10 +3355,10 @@ if __name__ == "__main__":
                     )
         if args.read_eeprom:
             print_opt = True
-            read_list = re.split(r',\s*', args.read_eeprom[0])
+            read_list = _READ_LIST_SPLIT_RE.split(args.read_eeprom[0])
             for value in read_list:
                 try:
-                    addr = int(ast.literal_eval(value))
+                    addr = int(value, 0)
                     val = printer.read_eeprom(addr, label='read_eeprom')
                     if val is None:
                         print("EEPROM read error.")
@@ -2912,13 +3373,13 @@ if __name__ == "__main__":
                     quit(1)
         if args.write_eeprom:
             print_opt = True
-            read_list = re.split(r',\s*|;\s*|\|\s*', args.write_eeprom[0])
+            read_list = _WRITE_LIST_SPLIT_RE.split(args.write_eeprom[0])
             for key_val in read_list:
-                key, val = re.split(':|=', key_val)
+                key, val = _WRITE_ITEM_SPLIT_RE.split(key_val)
                 try:
-                    val_int = ast.literal_eval(val)
+                    val_int = int(val, 0)
                     if not printer.write_eeprom(
-                            ast.literal_eval(key),
+                            int(key, 0),
                             str(val_int), label='write_eeprom'
                         ):
                         print("invalid write operation")
@@ -0,0 +1,87 @@
+import unittest
+from unittest import mock
+
+from epson_print_conf import EpsonPrinter
+
+
+class TestClose(unittest.TestCase):
+    def test_close_closes_the_transport_dispatcher(self):
+        printer = EpsonPrinter(model="XP-205", hostname="127.0.0.1")
+        dispatcher = mock.Mock()
+        printer.session = (dispatcher, mock.Mock(), mock.Mock())
+        printer.close()
+        dispatcher.transportDispatcher.closeDispatcher.assert_called_once_with()
+        self.assertIsNone(printer.session)
+
+    def test_close_without_session(self):
+        printer = EpsonPrinter(model="XP-205", hostname="127.0.0.1")
+        printer.close()
+        self.assertIsNone(printer.session)
+
+
+class TestBruteForceReadKey(unittest.TestCase):
+    def test_scan_skips_invalid_read_keys(self):
+        printer = EpsonPrinter(
+            conf_dict={
+                "Undetected": {"read_key": None},
+                "Invalid": {"read_key": 7},
+            },
+            model="XP-205"
+        )
+        printer.parm = dict(printer.parm, read_key=[25, 7])
+        printer.mib_dict = {
+            printer.eeprom_oid_read_address(0x00): (
+                "OctetString", b"\x00@BDC PS\r\nEE:000012;\x0c"
+            )
+        }
+        printer.parm["read_key"] = [0, 0]
+        self.assertEqual(printer.brute_force_read_key(7, 25), [25, 7])
+
+
+class TestReadEeprom(unittest.TestCase):
+    def test_cached_reads_are_not_logged_again(self):
+        printer = EpsonPrinter(model="XP-205", hostname="127.0.0.1")
+        printer.eeprom_cache_ttl = 5
+        response = ("OctetString", b"\x00@BDC PS\r\nEE:00103F;\x0c")
+        with mock.patch.object(
+                printer, "snmp_mib_many", return_value=[response]) as query:
+            with self.assertLogs(level="DEBUG") as logs:
+                self.assertEqual(printer.read_eeprom(0x10), "3F")
+                self.assertEqual(printer.read_eeprom(0x10), "3F")
+        query.assert_called_once()
+        self.assertEqual(
+            sum("EEPROM_DUMP" in line for line in logs.output), 1)
+
+    def test_direct_reads_are_not_cached_by_default(self):
+        printer = EpsonPrinter(model="XP-205", hostname="127.0.0.1")
+        responses = [
+            [("OctetString", b"\x00@BDC PS\r\nEE:00103F;\x0c")],
+            [("OctetString", b"\x00@BDC PS\r\nEE:001040;\x0c")],
+        ]
+        with mock.patch.object(
+                printer, "snmp_mib_many", side_effect=responses):
+            self.assertEqual(printer.read_eeprom(0x10), "3F")
+            self.assertEqual(printer.read_eeprom(0x10), "40")
+        self.assertFalse(printer.oid_cache)
+
+
+class TestOidCache(unittest.TestCase):
+    def test_cache_is_bounded_and_drops_expired_entries(self):
+        printer = EpsonPrinter(model="XP-205", hostname="127.0.0.1")
+        printer.oid_cache_size = 2
+        printer.cache_responses([("expired", ("OctetString", b"x"))], 0)
+        printer.cache_responses(
+            [(mib, ("OctetString", b"x")) for mib in ("1", "2", "3")], 60)
+        self.assertEqual(list(printer.oid_cache), ["2", "3"])
+
+
+class TestWriteEeprom(unittest.TestCase):
+    def test_non_octet_string_response_is_a_failed_write(self):
+        printer = EpsonPrinter(model="XP-205", hostname="127.0.0.1")
+        with mock.patch.object(
+                printer, "snmp_mib_many", return_value=[("Integer", "2")]):
+            self.assertFalse(printer.write_eeprom(0x10, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()